@@ -0,0 +1,340 @@
+"""
+A cache for responses from Vuforia.
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, NamedTuple, Optional, Set, Tuple
+
+from requests import Response
+
+
+class DecodedResponse(NamedTuple):
+    """
+    A response from Vuforia and its decoded JSON body.
+    """
+
+    response: Response
+    data: Dict[str, Any]
+
+
+class _CachedResponse(NamedTuple):
+    """
+    A stored response and the times, from ``time.monotonic``, until which it
+    can be used.
+    """
+
+    expires_at: float
+    stale_until: float
+    response: DecodedResponse
+
+
+def _directive_seconds(value: str) -> int:
+    """
+    Get a number of seconds from the value of a ``Cache-Control`` directive,
+    treating a value which is not a number of seconds as ``0``.
+    """
+    value = value.strip().strip('"')
+    return int(value) if value.isdigit() else 0
+
+
+def _lifetime_seconds(
+    response: DecodedResponse,
+    default_ttl_seconds: float,
+) -> Tuple[float, float]:
+    """
+    Get the number of seconds for which a response is fresh, and for which it
+    may be used while it is revalidated.
+
+    These are taken from the ``Cache-Control`` header's ``max-age`` and
+    ``stale-while-revalidate`` directives, if Vuforia sent them. A response
+    with a ``no-store`` or ``no-cache`` directive is not reused at all.
+
+    Args:
+        response: The response to get the lifetime of.
+        default_ttl_seconds: The number of seconds for which the response is
+            fresh if Vuforia did not send any of ``max-age``, ``no-store`` or
+            ``no-cache``.
+
+    Returns:
+        The number of seconds for which the response is fresh, and the number
+        of seconds after that for which it may be used while it is
+        revalidated.
+    """
+    cache_control = response.response.headers.get('Cache-Control', '')
+    directives: Dict[str, str] = {}
+    for directive in cache_control.split(','):
+        name, _, value = directive.partition('=')
+        directives[name.strip().lower()] = value
+
+    if 'no-store' in directives or 'no-cache' in directives:
+        return 0, 0
+
+    if 'max-age' not in directives:
+        return default_ttl_seconds, 0
+
+    return (
+        _directive_seconds(directives['max-age']),
+        _directive_seconds(directives.get('stale-while-revalidate', '')),
+    )
+
+
+def _discard_oldest(mapping: Dict[str, Any], maxsize: int) -> None:
+    """
+    Discard the oldest items of a mapping so that there is space for a new
+    item.
+    """
+    while mapping and len(mapping) >= maxsize:
+        oldest_key = next(iter(mapping))
+        del mapping[oldest_key]
+
+
+class ResponseCache:
+    """
+    A short-lived, thread safe cache of responses, keyed by request path.
+
+    Concurrent requests for the same request path share a single request to
+    Vuforia.
+
+    The cache also holds the latest response with an ``ETag`` for each
+    request path, for making conditional requests.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Args:
+            maxsize: The maximum number of responses, and separately of
+                responses with an ``ETag``, to store. When this is reached,
+                the oldest response is discarded.
+        """
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._responses: Dict[str, _CachedResponse] = {}
+        self._in_flight: Dict[str, 'Future[DecodedResponse]'] = {}
+        self._etags: Dict[str, Tuple[str, DecodedResponse]] = {}
+        self._revalidating: Set[str] = set()
+        self._revalidation_executor = ThreadPoolExecutor(max_workers=1)
+        self._generation = 0
+        self._closed = False
+
+    def get(
+        self,
+        request_path: str,
+        fetch: Callable[[], DecodedResponse],
+        is_cacheable: Callable[[Dict[str, Any]], bool],
+        default_ttl_seconds: float,
+        timeout_seconds: Optional[float] = None,
+    ) -> DecodedResponse:
+        """
+        Get a response for a request path, making a request only if there is
+        no fresh response and no matching request in flight.
+
+        A response which is stale but within its ``stale-while-revalidate``
+        window is returned while a new response is fetched in the background.
+
+        Args:
+            request_path: The path to the endpoint which the response is for.
+            fetch: A function which makes the request.
+            is_cacheable: A function which returns whether a response, given
+                its decoded JSON body, may be reused.
+            default_ttl_seconds: The number of seconds for which a response is
+                reused if Vuforia does not say otherwise with a
+                ``Cache-Control`` header.
+            timeout_seconds: The number of seconds to wait for a matching
+                request in flight to finish. If ``None`` is given, there is no
+                timeout.
+
+        Returns:
+            A response to a request to ``request_path``.
+
+        Raises:
+            concurrent.futures.TimeoutError: A matching request in flight did
+                not finish within ``timeout_seconds`` seconds.
+        """
+        with self._lock:
+            cached = self._responses.get(request_path)
+            if cached is not None:
+                now = time.monotonic()
+                if now < cached.expires_at:
+                    return cached.response
+
+                if now < cached.stale_until and not self._closed:
+                    if request_path not in self._revalidating:
+                        self._revalidating.add(request_path)
+                        self._revalidation_executor.submit(
+                            self._revalidate,
+                            request_path=request_path,
+                            fetch=fetch,
+                            is_cacheable=is_cacheable,
+                            default_ttl_seconds=default_ttl_seconds,
+                            generation=self._generation,
+                        )
+                    return cached.response
+
+                del self._responses[request_path]
+
+            in_flight = self._in_flight.get(request_path)
+            if in_flight is None:
+                future: 'Future[DecodedResponse]' = Future()
+                self._in_flight[request_path] = future
+                generation = self._generation
+
+        if in_flight is not None:
+            return in_flight.result(timeout=timeout_seconds)
+
+        try:
+            response = fetch()
+        except BaseException as exc:
+            with self._lock:
+                if self._in_flight.get(request_path) is future:
+                    del self._in_flight[request_path]
+            future.set_exception(exc)
+            raise
+
+        with self._lock:
+            if self._in_flight.get(request_path) is future:
+                del self._in_flight[request_path]
+            self._store(
+                request_path=request_path,
+                response=response,
+                is_cacheable=is_cacheable,
+                default_ttl_seconds=default_ttl_seconds,
+                generation=generation,
+            )
+
+        future.set_result(response)
+        return response
+
+    def _revalidate(
+        self,
+        request_path: str,
+        fetch: Callable[[], DecodedResponse],
+        is_cacheable: Callable[[Dict[str, Any]], bool],
+        default_ttl_seconds: float,
+        generation: int,
+    ) -> None:
+        """
+        Replace a stale response in the background.
+
+        If the request fails, the stale response is discarded so that the
+        next caller makes the request and sees the error.
+        """
+        response: Optional[DecodedResponse]
+        try:
+            response = fetch()
+        except Exception:  # pylint: disable=broad-except
+            response = None
+
+        with self._lock:
+            self._revalidating.discard(request_path)
+            if response is None:
+                if generation == self._generation:
+                    self._responses.pop(request_path, None)
+                return
+
+            self._store(
+                request_path=request_path,
+                response=response,
+                is_cacheable=is_cacheable,
+                default_ttl_seconds=default_ttl_seconds,
+                generation=generation,
+            )
+
+    def _store(
+        self,
+        request_path: str,
+        response: DecodedResponse,
+        is_cacheable: Callable[[Dict[str, Any]], bool],
+        default_ttl_seconds: float,
+        generation: int,
+    ) -> None:
+        """
+        Store a response, if it may be reused. This must be called with the
+        lock held.
+        """
+        # Responses to requests which overlapped with an invalidation may be
+        # out of date.
+        if generation != self._generation or not is_cacheable(response.data):
+            return
+
+        ttl_seconds, stale_seconds = _lifetime_seconds(
+            response=response,
+            default_ttl_seconds=default_ttl_seconds,
+        )
+        if ttl_seconds + stale_seconds <= 0:
+            self._responses.pop(request_path, None)
+            return
+
+        self._responses.pop(request_path, None)
+        _discard_oldest(mapping=self._responses, maxsize=self._maxsize)
+
+        expires_at = time.monotonic() + ttl_seconds
+        self._responses[request_path] = _CachedResponse(
+            expires_at=expires_at,
+            stale_until=expires_at + stale_seconds,
+            response=response,
+        )
+
+    def get_etag(
+        self,
+        request_path: str,
+    ) -> Optional[Tuple[str, DecodedResponse]]:
+        """
+        Get the latest response with an ``ETag`` for a request path.
+
+        Args:
+            request_path: The path to the endpoint which the response is for.
+
+        Returns:
+            The ``ETag`` and the response which it was sent with, or ``None``
+            if there is no such response.
+        """
+        with self._lock:
+            return self._etags.get(request_path)
+
+    def store_etag(
+        self,
+        request_path: str,
+        etag: Optional[str],
+        response: DecodedResponse,
+    ) -> None:
+        """
+        Store the latest response for a request path, if it has an ``ETag``.
+
+        Args:
+            request_path: The path to the endpoint which the response is for.
+            etag: The ``ETag`` sent with the response. If this is ``None``,
+                any earlier response for the request path is discarded.
+            response: The response.
+        """
+        with self._lock:
+            self._etags.pop(request_path, None)
+            if etag is None:
+                return
+
+            _discard_oldest(mapping=self._etags, maxsize=self._maxsize)
+            self._etags[request_path] = (etag, response)
+
+    def clear(self) -> None:
+        """
+        Discard all stored responses.
+
+        Responses with an ``ETag`` are kept, as Vuforia checks whether they
+        are up to date before they are reused.
+
+        Requests which are in flight are not shared with later callers, and
+        their responses are not stored.
+        """
+        with self._lock:
+            self._generation += 1
+            self._responses.clear()
+            self._in_flight.clear()
+
+    def close(self) -> None:
+        """
+        Stop revalidating responses in the background.
+        """
+        with self._lock:
+            self._closed = True
+        self._revalidation_executor.shutdown(wait=False)
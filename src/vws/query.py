@@ -7,6 +7,7 @@ import io
 from typing import List, Optional
 from urllib.parse import urljoin
 
+import orjson
 import requests
 from urllib3.filepost import encode_multipart_formdata
 from vws_auth_tools import authorization_header, rfc_1123_date
@@ -143,7 +144,8 @@ class CloudRecoService:
         if 'No content to map due to end-of-input' in response.text:
             raise MatchProcessing(response=response)
 
-        result_code = response.json()['result_code']
+        response_data = orjson.loads(response.content)
+        result_code = response_data['result_code']
         if result_code != 'Success':
             exception = {
                 'AuthenticationFailure': AuthenticationFailure,
@@ -154,7 +156,7 @@ class CloudRecoService:
             raise exception(response=response)
 
         result = []
-        result_list = list(response.json()['results'])
+        result_list = response_data['results']
         for item in result_list:
             target_data: Optional[TargetData] = None
             if 'target_data' in item:
@@ -2,20 +2,25 @@
 Tools for interacting with Vuforia APIs.
 """
 
+import asyncio
 import base64
+import concurrent.futures
+import email.utils
+import functools
 import io
-import json
+import time
 from datetime import date
-from time import sleep
-from typing import Dict, List, Optional, Union
+from types import TracebackType
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
 from urllib.parse import urljoin
 
+import orjson
 import requests
-from func_timeout import func_set_timeout
-from func_timeout.exceptions import FunctionTimedOut
-from requests import Response
-from vws_auth_tools import authorization_header, rfc_1123_date
+from requests import Response, codes
+from requests.adapters import HTTPAdapter
+from vws_auth_tools import authorization_header
 
+from vws._response_cache import DecodedResponse, ResponseCache
 from vws.exceptions.custom_exceptions import (
     TargetProcessingTimeout,
     UnknownVWSErrorPossiblyBadName,
@@ -46,22 +51,121 @@ from vws.reports import (
     TargetSummaryReport,
 )
 
+_T = TypeVar('_T')
+
+# The time waited between polling requests doubles after each request for a
+# target which is still processing, up to this ceiling.
+_MAX_SECONDS_BETWEEN_REQUESTS = 5.0
+
+# Details of a target which is not processing are reused for this long, unless
+# Vuforia sends a ``Cache-Control`` header saying otherwise.
+_TARGET_DETAILS_TTL_SECONDS = 1
+
+_CONTENT_TYPE = 'application/json'
+_HEADERS_TEMPLATE = {'Content-Type': _CONTENT_TYPE}
+
+
+def _next_seconds_between_requests(
+    seconds_between_requests: float,
+    initial_seconds_between_requests: float,
+) -> float:
+    """
+    Get the number of seconds to wait before the next polling request.
+
+    Args:
+        seconds_between_requests: The number of seconds waited before the
+            latest polling request.
+        initial_seconds_between_requests: The number of seconds waited before
+            the first repeated polling request.
+
+    Returns:
+        Double ``seconds_between_requests``, capped at five seconds or at
+        ``initial_seconds_between_requests`` if that is greater.
+    """
+    ceiling = max(
+        _MAX_SECONDS_BETWEEN_REQUESTS,
+        initial_seconds_between_requests,
+    )
+    return min(seconds_between_requests * 2, ceiling)
+
+
+def _base64_encode(data: bytes) -> str:
+    """
+    Base64 encode data.
+
+    Args:
+        data: The data to encode.
+
+    Returns:
+        The Base64 encoded data as an ASCII string.
+    """
+    return base64.b64encode(data).decode('ascii')
+
+
+def _is_always_cacheable(
+    response_data: Dict[str, Any],  # pylint: disable=unused-argument
+) -> bool:
+    """
+    Return ``True``, so that any successful response may be reused.
+    """
+    return True
+
+
+def _is_not_processing(response_data: Dict[str, Any]) -> bool:
+    """
+    Return whether a decoded response describes a target which is not
+    processing.
+
+    Details of a target which is processing are expected to change soon.
+    """
+    return bool(response_data['status'] != TargetStatuses.PROCESSING.value)
+
+
+@functools.lru_cache(maxsize=2)
+def _rfc_1123_date_for_second(second: int) -> str:
+    """
+    Format a time as per RFC 2616, section 3.3.1, rfc1123-date.
+
+    Args:
+        second: A whole number of seconds since the epoch.
+
+    Returns:
+        The formatted date.
+    """
+    return email.utils.formatdate(second, localtime=False, usegmt=True)
+
+
+def _rfc_1123_date() -> str:
+    """
+    Return the current date formatted as per RFC 2616, section 3.3.1,
+    rfc1123-date, as needed by the VWS API.
+
+    These dates only have a resolution of one second, so the formatted date
+    is reused for requests made within the same second.
+    """
+    return _rfc_1123_date_for_second(int(time.time()))
+
 
 def _target_api_request(
+    session: requests.Session,
     server_access_key: str,
     server_secret_key: str,
     method: str,
     content: bytes,
     request_path: str,
     base_vws_url: str,
+    etag: Optional[str] = None,
+    timeout_seconds: Optional[float] = None,
 ) -> Response:
     """
     Make a request to the Vuforia Target API.
 
-    This uses `requests` to make a request against https://vws.vuforia.com.
+    This uses a `requests` session to make a request against
+    https://vws.vuforia.com.
     The content type of the request will be `application/json`.
 
     Args:
+        session: The session to make the request with.
         server_access_key: A VWS server access key.
         server_secret_key: A VWS server secret key.
         method: The HTTP method which will be used in the request.
@@ -69,36 +173,45 @@ def _target_api_request(
         request_path: The path to the endpoint which will be used in the
             request.
         base_vws_url: The base URL for the VWS API.
+        etag: An ``ETag`` from an earlier response to a request to the same
+            endpoint. If this is given, it is sent as ``If-None-Match`` so
+            that Vuforia can respond with ``304 Not Modified``.
+        timeout_seconds: The number of seconds to wait for Vuforia to respond
+            before raising ``requests.exceptions.Timeout``. If ``None`` is
+            given, there is no timeout.
 
     Returns:
         The response to the request made by `requests`.
     """
-    date_string = rfc_1123_date()
-    content_type = 'application/json'
+    date_string = _rfc_1123_date()
 
     signature_string = authorization_header(
         access_key=server_access_key,
         secret_key=server_secret_key,
         method=method,
         content=content,
-        content_type=content_type,
+        content_type=_CONTENT_TYPE,
         date=date_string,
         request_path=request_path,
     )
 
     headers = {
+        **_HEADERS_TEMPLATE,
         'Authorization': signature_string,
         'Date': date_string,
-        'Content-Type': content_type,
     }
 
+    if etag is not None:
+        headers['If-None-Match'] = etag
+
     url = urljoin(base=base_vws_url, url=request_path)
 
-    response = requests.request(
+    response = session.request(
         method=method,
         url=url,
         headers=headers,
         data=content,
+        timeout=timeout_seconds,
     )
 
     return response
@@ -124,6 +237,67 @@ class VWS:
         self._server_access_key = server_access_key
         self._server_secret_key = server_secret_key
         self._base_vws_url = base_vws_url
+        self._response_cache = ResponseCache(maxsize=1024)
+        # The same image is often given for many targets, so the most recent
+        # encodings are reused. These are held only by this client, and only
+        # a couple are held, so that images are not kept alive for long.
+        self._base64_encode: Callable[[bytes], str] = functools.lru_cache(
+            maxsize=2,
+        )(_base64_encode)
+        self._session = requests.Session()
+        # Connections are pooled so that they can be reused across requests,
+        # including requests made concurrently by the asynchronous methods.
+        self._session.mount(
+            prefix='https://',
+            adapter=HTTPAdapter(pool_connections=10, pool_maxsize=20),
+        )
+
+    def __enter__(self) -> 'VWS':
+        """
+        Use the client as a context manager which closes it on exit.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """
+        Close the client.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the connections held by the client.
+        """
+        self._session.close()
+        self._response_cache.close()
+
+    async def _run_in_executor(
+        self,
+        func: Callable[..., _T],
+        **kwargs: Any,
+    ) -> _T:
+        """
+        Run a blocking method in the event loop's default executor.
+
+        This allows multiple requests to Vuforia to be in flight at once.
+
+        Args:
+            func: The blocking function to run.
+            kwargs: Keyword arguments to give to ``func``.
+
+        Returns:
+            The return value of ``func``.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(func, **kwargs),
+        )
 
     def _make_request(
         self,
@@ -131,13 +305,18 @@ class VWS:
         content: bytes,
         request_path: str,
         expected_result_code: str,
-    ) -> Response:
+        timeout_seconds: Optional[float] = None,
+    ) -> DecodedResponse:
         """
         Make a request to the Vuforia Target API.
 
         This uses `requests` to make a request against https://vws.vuforia.com.
         The content type of the request will be `application/json`.
 
+        ``GET`` requests are conditional on the ``ETag`` of the last successful
+        response to the same endpoint, if Vuforia sent one. If Vuforia
+        responds with ``304 Not Modified``, that last response is returned.
+
         Args:
             method: The HTTP method which will be used in the request.
             content: The request body which will be used in the request.
@@ -145,9 +324,12 @@ class VWS:
                 request.
             expected_result_code: See
                 https://library.vuforia.com/articles/Solution/How-To-Use-the-Vuforia-Web-Services-API.html#How-To-Interperete-VWS-API-Result-Codes
+            timeout_seconds: The number of seconds to wait for Vuforia to
+                respond. If ``None`` is given, there is no timeout.
 
         Returns:
-            The response to the request made by `requests`.
+            The response to the request made by `requests`, with its decoded
+            JSON body.
 
         Raises:
             ~vws.exceptions.UnknownVWSErrorPossiblyBadName: Vuforia returns an
@@ -155,23 +337,53 @@ class VWS:
                 been seen to happen when the given name includes a bad
                 character.
         """
+        stored_etag: Optional[str] = None
+        stored_response: Optional[DecodedResponse] = None
+        if method == 'GET':
+            stored = self._response_cache.get_etag(request_path=request_path)
+            if stored is not None:
+                stored_etag, stored_response = stored
+
         response = _target_api_request(
+            session=self._session,
             server_access_key=self._server_access_key,
             server_secret_key=self._server_secret_key,
             method=method,
             content=content,
             request_path=request_path,
             base_vws_url=self._base_vws_url,
+            etag=stored_etag,
+            timeout_seconds=timeout_seconds,
         )
 
+        if method != 'GET':
+            self._response_cache.clear()
+
+        if (
+            stored_response is not None
+            and response.status_code == codes.not_modified
+        ):
+            return stored_response
+
         try:
-            result_code = response.json()['result_code']
-        except json.decoder.JSONDecodeError as exc:
+            response_data = orjson.loads(response.content)
+        except orjson.JSONDecodeError as exc:
             assert 'Oops' in response.text, response.text
             raise UnknownVWSErrorPossiblyBadName() from exc
 
+        result_code = response_data['result_code']
         if result_code == expected_result_code:
-            return response
+            decoded_response = DecodedResponse(
+                response=response,
+                data=response_data,
+            )
+            if method == 'GET':
+                self._response_cache.store_etag(
+                    request_path=request_path,
+                    etag=response.headers.get('ETag'),
+                    response=decoded_response,
+                )
+            return decoded_response
 
         exception = {
             'AuthenticationFailure': AuthenticationFailure,
@@ -194,6 +406,49 @@ class VWS:
 
         raise exception(response=response)
 
+    def _make_cached_request(
+        self,
+        request_path: str,
+        default_ttl_seconds: float,
+        is_cacheable: Callable[[Dict[str, Any]], bool],
+        timeout_seconds: Optional[float] = None,
+    ) -> DecodedResponse:
+        """
+        Make a ``GET`` request to the Vuforia Target API, reusing a recent
+        response if there is one.
+
+        Responses are reused for as long as Vuforia allows with a
+        ``Cache-Control`` header, or otherwise for ``default_ttl_seconds``.
+
+        Args:
+            request_path: The path to the endpoint which will be used in the
+                request.
+            default_ttl_seconds: The number of seconds for which a response is
+                reused if Vuforia does not send a ``max-age``.
+            is_cacheable: A function which returns whether a response, given
+                its decoded JSON body, may be reused.
+            timeout_seconds: The number of seconds to wait for a response. If
+                ``None`` is given, there is no timeout.
+
+        Returns:
+            The response to the request made by `requests`, with its decoded
+            JSON body.
+        """
+        return self._response_cache.get(
+            request_path=request_path,
+            fetch=functools.partial(
+                self._make_request,
+                method='GET',
+                content=b'',
+                request_path=request_path,
+                expected_result_code='Success',
+                timeout_seconds=timeout_seconds,
+            ),
+            is_cacheable=is_cacheable,
+            default_ttl_seconds=default_ttl_seconds,
+            timeout_seconds=timeout_seconds,
+        )
+
     def add_target(
         self,
         name: str,
@@ -248,18 +503,23 @@ class VWS:
                 occurred". This has been seen to happen when the given name
                 includes a bad character.
         """
-        image_data = image.getvalue()
-        image_data_encoded = base64.b64encode(image_data).decode('ascii')
-
-        data = {
+        # Unlike the Cloud Recognition API, the Target API only accepts JSON
+        # bodies, so images cannot be sent as raw multipart form data.
+        data: Dict[str, Union[str, bool, float, int]] = {
             'name': name,
             'width': width,
-            'image': image_data_encoded,
-            'active_flag': active_flag,
-            'application_metadata': application_metadata,
+            'image': self._base64_encode(image.getvalue()),
         }
 
-        content = bytes(json.dumps(data), encoding='utf-8')
+        # Fields which match Vuforia's defaults are left out, to keep the
+        # signed request body small.
+        if active_flag is not True:
+            data['active_flag'] = active_flag
+
+        if application_metadata is not None:
+            data['application_metadata'] = application_metadata
+
+        content = orjson.dumps(data)
 
         response = self._make_request(
             method='POST',
@@ -268,7 +528,41 @@ class VWS:
             expected_result_code='TargetCreated',
         )
 
-        return str(response.json()['target_id'])
+        return str(response.data['target_id'])
+
+    async def add_target_async(
+        self,
+        name: str,
+        width: Union[int, float],
+        image: io.BytesIO,
+        active_flag: bool,
+        application_metadata: Optional[str],
+    ) -> str:
+        """
+        Add a target to a Vuforia Web Services database without blocking the
+        event loop.
+
+        See :meth:`add_target` for details, including the exceptions which
+        may be raised.
+
+        Args:
+            name: The name of the target.
+            width: The width of the target.
+            image: The image of the target.
+            active_flag: Whether or not the target is active for query.
+            application_metadata: The application metadata of the target.
+
+        Returns:
+            The target ID of the new target.
+        """
+        return await self._run_in_executor(
+            self.add_target,
+            name=name,
+            width=width,
+            image=image,
+            active_flag=active_flag,
+            application_metadata=application_metadata,
+        )
 
     def get_target_record(self, target_id: str) -> TargetStatusAndRecord:
         """
@@ -294,16 +588,15 @@ class VWS:
             ~vws.exceptions.vws_exceptions.RequestTimeTooSkewed: There is an
                 error with the time sent to Vuforia.
         """
-        response = self._make_request(
-            method='GET',
-            content=b'',
+        response = self._make_cached_request(
             request_path=f'/targets/{target_id}',
-            expected_result_code='Success',
+            default_ttl_seconds=_TARGET_DETAILS_TTL_SECONDS,
+            is_cacheable=_is_not_processing,
         )
 
-        result_data = response.json()
+        result_data = response.data
         status = TargetStatuses(result_data['status'])
-        target_record_dict = dict(result_data['target_record'])
+        target_record_dict = result_data['target_record']
         target_record = TargetRecord(
             target_id=target_record_dict['target_id'],
             active_flag=target_record_dict['active_flag'],
@@ -318,18 +611,49 @@ class VWS:
         )
         return target_status_and_record
 
-    def _wait_for_target_processed(
+    async def get_target_record_async(
         self,
         target_id: str,
-        seconds_between_requests: float,
+    ) -> TargetStatusAndRecord:
+        """
+        Get a given target's target record without blocking the event loop.
+
+        See :meth:`get_target_record` for details, including the exceptions
+        which may be raised.
+
+        Args:
+            target_id: The ID of the target to get details of.
+
+        Returns:
+            Response details of a target from Vuforia.
+        """
+        return await self._run_in_executor(
+            self.get_target_record,
+            target_id=target_id,
+        )
+
+    def wait_for_target_processed(
+        self,
+        target_id: str,
+        seconds_between_requests: float = 0.2,
+        timeout_seconds: Optional[float] = 60 * 5,
     ) -> None:
         """
-        Wait indefinitely for a target to get past the processing stage.
+        Wait up to five minutes (arbitrary) for a target to get past the
+        processing stage.
 
         Args:
             target_id: The ID of the target to wait for.
             seconds_between_requests: The number of seconds to wait between
-                requests made while polling the target status.
+                the first and second requests made while polling the target
+                status. This doubles after each request, up to five seconds.
+                We wait 0.2 seconds by default, rather than less, than that to
+                decrease the number of calls made to the API, to decrease the
+                likelihood of hitting the request quota.
+            timeout_seconds: The maximum number of seconds to wait for the
+                target to be processed. Each request made while waiting is
+                given the time remaining as its timeout. If ``None`` is given,
+                no maximum is applied.
 
         Raises:
             ~vws.exceptions.vws_exceptions.AuthenticationFailure: The secret
@@ -337,40 +661,154 @@ class VWS:
             ~vws.exceptions.vws_exceptions.Fail: There was an error with the
                 request. For example, the given access key does not match a
                 known database.
-            TimeoutError: The target remained in the processing stage for more
-                than five minutes.
+            ~vws.exceptions.custom_exceptions.TargetProcessingTimeout: The
+                target remained in the processing stage for more than
+                ``timeout_seconds`` seconds.
             ~vws.exceptions.vws_exceptions.UnknownTarget: The given target ID
                 does not match a target in the database.
             ~vws.exceptions.vws_exceptions.RequestTimeTooSkewed: There is an
                 error with the time sent to Vuforia.
         """
+        deadline = (
+            None
+            if timeout_seconds is None
+            else time.monotonic() + timeout_seconds
+        )
+        delay = seconds_between_requests
         while True:
-            report = self.get_target_summary_report(target_id=target_id)
+            remaining_seconds = (
+                None if deadline is None else deadline - time.monotonic()
+            )
+            if remaining_seconds is not None and remaining_seconds <= 0:
+                raise TargetProcessingTimeout
+
+            try:
+                report = self._get_target_summary_report(
+                    target_id=target_id,
+                    timeout_seconds=remaining_seconds,
+                )
+            except (
+                requests.exceptions.Timeout,
+                concurrent.futures.TimeoutError,
+            ) as exc:
+                raise TargetProcessingTimeout from exc
+
             if report.status != TargetStatuses.PROCESSING:
                 return
 
-            sleep(seconds_between_requests)
+            if deadline is None:
+                time.sleep(delay)
+            else:
+                time.sleep(max(0, min(delay, deadline - time.monotonic())))
 
-    def wait_for_target_processed(
+            delay = _next_seconds_between_requests(
+                seconds_between_requests=delay,
+                initial_seconds_between_requests=seconds_between_requests,
+            )
+
+    async def _wait_for_targets_processed(
         self,
-        target_id: str,
+        target_ids: List[str],
+        seconds_between_requests: float,
+        timeout_seconds: Optional[float],
+    ) -> None:
+        """
+        Wait for targets to get past the processing stage.
+
+        The status of every target which is still processing is requested
+        concurrently.
+
+        Args:
+            target_ids: The IDs of the targets to wait for.
+            seconds_between_requests: The number of seconds to wait between
+                the first and second rounds of requests made while polling the
+                target statuses. This doubles after each round, up to five
+                seconds.
+            timeout_seconds: The maximum number of seconds to wait for all of
+                the targets to be processed. Each request is given the time
+                remaining as its timeout, so that no request made in a worker
+                thread outlives the wait. If ``None`` is given, no maximum is
+                applied.
+
+        Raises:
+            ~vws.exceptions.custom_exceptions.TargetProcessingTimeout: A
+                target remained in the processing stage for more than
+                ``timeout_seconds`` seconds.
+        """
+        deadline = (
+            None
+            if timeout_seconds is None
+            else time.monotonic() + timeout_seconds
+        )
+        delay = seconds_between_requests
+        pending = list(target_ids)
+        while True:
+            remaining_seconds = (
+                None if deadline is None else deadline - time.monotonic()
+            )
+            if remaining_seconds is not None and remaining_seconds <= 0:
+                raise TargetProcessingTimeout
+
+            try:
+                reports = await asyncio.gather(
+                    *(
+                        self._run_in_executor(
+                            self._get_target_summary_report,
+                            target_id=target_id,
+                            timeout_seconds=remaining_seconds,
+                        )
+                        for target_id in pending
+                    ),
+                )
+            except (
+                requests.exceptions.Timeout,
+                concurrent.futures.TimeoutError,
+            ) as exc:
+                raise TargetProcessingTimeout from exc
+
+            pending = [
+                target_id
+                for target_id, report in zip(pending, reports)
+                if report.status == TargetStatuses.PROCESSING
+            ]
+            if not pending:
+                return
+
+            if deadline is None:
+                await asyncio.sleep(delay)
+            else:
+                await asyncio.sleep(
+                    max(0, min(delay, deadline - time.monotonic())),
+                )
+
+            delay = _next_seconds_between_requests(
+                seconds_between_requests=delay,
+                initial_seconds_between_requests=seconds_between_requests,
+            )
+
+    def wait_for_targets_processed(
+        self,
+        target_ids: List[str],
         seconds_between_requests: float = 0.2,
         timeout_seconds: Optional[float] = 60 * 5,
     ) -> None:
         """
-        Wait up to five minutes (arbitrary) for a target to get past the
-        processing stage.
+        Wait up to five minutes (arbitrary) for multiple targets to get past
+        the processing stage.
+
+        This polls the targets concurrently, rather than waiting for each
+        target in turn.
 
         Args:
-            target_id: The ID of the target to wait for.
+            target_ids: The IDs of the targets to wait for.
             seconds_between_requests: The number of seconds to wait between
-                requests made while polling the target status.
-                We wait 0.2 seconds by default, rather than less, than that to
-                decrease the number of calls made to the API, to decrease the
-                likelihood of hitting the request quota.
-            timeout_seconds: The maximum number of seconds to wait for the
-                target to be processed. If ``None`` is given, no maximum is
-                applied.
+                the first and second rounds of requests made while polling the
+                target statuses. This doubles after each round, up to five
+                seconds.
+            timeout_seconds: The maximum number of seconds to wait for all of
+                the targets to be processed. Each request made while waiting
+                is given the time remaining as its timeout. If ``None`` is
+                given, no maximum is applied.
 
         Raises:
             ~vws.exceptions.vws_exceptions.AuthenticationFailure: The secret
@@ -378,26 +816,52 @@ class VWS:
             ~vws.exceptions.vws_exceptions.Fail: There was an error with the
                 request. For example, the given access key does not match a
                 known database.
-            ~vws.exceptions.custom_exceptions.TargetProcessingTimeout: The
+            ~vws.exceptions.custom_exceptions.TargetProcessingTimeout: A
                 target remained in the processing stage for more than
                 ``timeout_seconds`` seconds.
-            ~vws.exceptions.vws_exceptions.UnknownTarget: The given target ID
+            ~vws.exceptions.vws_exceptions.UnknownTarget: A given target ID
                 does not match a target in the database.
             ~vws.exceptions.vws_exceptions.RequestTimeTooSkewed: There is an
                 error with the time sent to Vuforia.
         """
-
-        @func_set_timeout(timeout=timeout_seconds)
-        def decorated() -> None:
-            self._wait_for_target_processed(
-                target_id=target_id,
+        asyncio.run(
+            self.wait_for_targets_processed_async(
+                target_ids=target_ids,
                 seconds_between_requests=seconds_between_requests,
-            )
+                timeout_seconds=timeout_seconds,
+            ),
+        )
 
-        try:
-            decorated()
-        except FunctionTimedOut as exc:
-            raise TargetProcessingTimeout from exc
+    async def wait_for_targets_processed_async(
+        self,
+        target_ids: List[str],
+        seconds_between_requests: float = 0.2,
+        timeout_seconds: Optional[float] = 60 * 5,
+    ) -> None:
+        """
+        Wait up to five minutes (arbitrary) for multiple targets to get past
+        the processing stage, without blocking the event loop.
+
+        See :meth:`wait_for_targets_processed` for details, including the
+        exceptions which may be raised.
+
+        Args:
+            target_ids: The IDs of the targets to wait for.
+            seconds_between_requests: The number of seconds to wait between
+                the first and second rounds of requests made while polling the
+                target statuses. This doubles after each round, up to five
+                seconds.
+            timeout_seconds: The maximum number of seconds to wait for all of
+                the targets to be processed. Each request made while waiting
+                is given the time remaining as its timeout, so a slow response
+                cannot hold up the event loop's executor past this. If
+                ``None`` is given, no maximum is applied.
+        """
+        await self._wait_for_targets_processed(
+            target_ids=target_ids,
+            seconds_between_requests=seconds_between_requests,
+            timeout_seconds=timeout_seconds,
+        )
 
     def list_targets(self) -> List[str]:
         """
@@ -418,14 +882,27 @@ class VWS:
             ~vws.exceptions.vws_exceptions.RequestTimeTooSkewed: There is an
                 error with the time sent to Vuforia.
         """
-        response = self._make_request(
-            method='GET',
-            content=b'',
+        response = self._make_cached_request(
             request_path='/targets',
-            expected_result_code='Success',
+            default_ttl_seconds=0,
+            is_cacheable=_is_always_cacheable,
         )
 
-        return list(response.json()['results'])
+        # The decoded body may be reused for later calls, so callers get a
+        # copy which they can change.
+        return list(response.data['results'])
+
+    async def list_targets_async(self) -> List[str]:
+        """
+        List target IDs without blocking the event loop.
+
+        See :meth:`list_targets` for details, including the exceptions which
+        may be raised.
+
+        Returns:
+            The IDs of all targets in the database.
+        """
+        return await self._run_in_executor(self.list_targets)
 
     def get_target_summary_report(self, target_id: str) -> TargetSummaryReport:
         """
@@ -451,14 +928,35 @@ class VWS:
             ~vws.exceptions.vws_exceptions.RequestTimeTooSkewed: There is an
                 error with the time sent to Vuforia.
         """
-        response = self._make_request(
-            method='GET',
-            content=b'',
+        return self._get_target_summary_report(target_id=target_id)
+
+    def _get_target_summary_report(
+        self,
+        target_id: str,
+        timeout_seconds: Optional[float] = None,
+    ) -> TargetSummaryReport:
+        """
+        Get a summary report for a target.
+
+        See :meth:`get_target_summary_report` for details, including the
+        exceptions which may be raised.
+
+        Args:
+            target_id: The ID of the target to get a summary report for.
+            timeout_seconds: The number of seconds to wait for Vuforia to
+                respond. If ``None`` is given, there is no timeout.
+
+        Returns:
+            Details of the target.
+        """
+        response = self._make_cached_request(
             request_path=f'/summary/{target_id}',
-            expected_result_code='Success',
+            default_ttl_seconds=_TARGET_DETAILS_TTL_SECONDS,
+            is_cacheable=_is_not_processing,
+            timeout_seconds=timeout_seconds,
         )
 
-        result_data = dict(response.json())
+        result_data = response.data
         return TargetSummaryReport(
             status=TargetStatuses(result_data['status']),
             database_name=result_data['database_name'],
@@ -490,14 +988,13 @@ class VWS:
             ~vws.exceptions.vws_exceptions.RequestTimeTooSkewed: There is an
                 error with the time sent to Vuforia.
         """
-        response = self._make_request(
-            method='GET',
-            content=b'',
+        response = self._make_cached_request(
             request_path='/summary',
-            expected_result_code='Success',
+            default_ttl_seconds=0,
+            is_cacheable=_is_always_cacheable,
         )
 
-        response_data = dict(response.json())
+        response_data = response.data
         database_summary_report = DatabaseSummaryReport(
             active_images=response_data['active_images'],
             current_month_recos=response_data['current_month_recos'],
@@ -577,7 +1074,9 @@ class VWS:
             expected_result_code='Success',
         )
 
-        return list(response.json()['similar_targets'])
+        # The decoded body may be reused for later calls, so callers get a
+        # copy which they can change.
+        return list(response.data['similar_targets'])
 
     def update_target(
         self,
@@ -638,9 +1137,7 @@ class VWS:
             data['width'] = width
 
         if image is not None:
-            image_data = image.getvalue()
-            image_data_encoded = base64.b64encode(image_data).decode('ascii')
-            data['image'] = image_data_encoded
+            data['image'] = self._base64_encode(image.getvalue())
 
         if active_flag is not None:
             data['active_flag'] = active_flag
@@ -648,7 +1145,7 @@ class VWS:
         if application_metadata is not None:
             data['application_metadata'] = application_metadata
 
-        content = bytes(json.dumps(data), encoding='utf-8')
+        content = orjson.dumps(data)
 
         self._make_request(
             method='PUT',
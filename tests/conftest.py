@@ -27,10 +27,11 @@ def vws_client(_mock_database: VuforiaDatabase) -> Iterator[VWS]:
     """
     Yield a VWS client which connects to a mock database.
     """
-    yield VWS(
+    with VWS(
         server_access_key=_mock_database.server_access_key,
         server_secret_key=_mock_database.server_secret_key,
-    )
+    ) as vws_client:
+        yield vws_client
 
 
 @pytest.fixture()
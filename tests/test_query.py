@@ -3,8 +3,12 @@ Tests for the ``CloudRecoService`` querying functionality.
 """
 
 import io
+import pkgutil
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List
 
+import pytest
 from mock_vws import MockVWS
 from mock_vws.database import VuforiaDatabase
 
@@ -12,6 +16,92 @@ from vws import VWS, CloudRecoService
 from vws.include_target_data import CloudRecoIncludeTargetData
 
 
+@pytest.fixture(scope='module')
+def _shared_mock_database() -> Iterator[VuforiaDatabase]:
+    """
+    Yield a mock ``VuforiaDatabase`` which is shared by tests in this module.
+    """
+    with MockVWS() as mock:
+        database = VuforiaDatabase()
+        mock.add_database(database=database)
+        yield database
+
+
+@pytest.fixture(scope='module')
+def _shared_vws_client(
+    _shared_mock_database: VuforiaDatabase,
+) -> Iterator[VWS]:
+    """
+    Yield a VWS client which connects to the shared mock database.
+    """
+    with VWS(
+        server_access_key=_shared_mock_database.server_access_key,
+        server_secret_key=_shared_mock_database.server_secret_key,
+    ) as vws_client:
+        yield vws_client
+
+
+@pytest.fixture(scope='module')
+def shared_cloud_reco_client(
+    _shared_mock_database: VuforiaDatabase,
+) -> CloudRecoService:
+    """
+    Return a ``CloudRecoService`` client which connects to the shared mock
+    database.
+    """
+    return CloudRecoService(
+        client_access_key=_shared_mock_database.client_access_key,
+        client_secret_key=_shared_mock_database.client_secret_key,
+    )
+
+
+@pytest.fixture(scope='module')
+def _shared_image_data() -> bytes:
+    """
+    Return the contents of the image file given by ``high_quality_image``.
+
+    ``high_quality_image`` is function scoped, so it cannot be used by module
+    scoped fixtures.
+    """
+    # VWS-Test-Fixtures ships this file as package data, from at least the
+    # version pinned in ``dev-requirements.txt``.
+    image_data = pkgutil.get_data(
+        package='vws_test_fixtures',
+        resource='high_quality_image.jpg',
+    )
+    assert image_data is not None
+    return image_data
+
+
+@pytest.fixture(scope='module')
+def processed_target_ids(
+    _shared_vws_client: VWS,
+    _shared_image_data: bytes,
+) -> List[str]:
+    """
+    Return the IDs of three processed targets which match
+    ``high_quality_image``, in the shared mock database.
+
+    Tests must not change these targets.
+    """
+
+    def add_target(name: str) -> str:
+        return _shared_vws_client.add_target(
+            name=name,
+            width=1,
+            image=io.BytesIO(_shared_image_data),
+            active_flag=True,
+            application_metadata=None,
+        )
+
+    names = [uuid.uuid4().hex for _ in range(3)]
+    with ThreadPoolExecutor(max_workers=len(names)) as executor:
+        target_ids = list(executor.map(add_target, names))
+
+    _shared_vws_client.wait_for_targets_processed(target_ids=target_ids)
+    return target_ids
+
+
 class TestQuery:
     """
     Tests for making image queries.
@@ -97,66 +187,28 @@ class TestMaxNumResults:
 
     def test_default(
         self,
-        vws_client: VWS,
-        cloud_reco_client: CloudRecoService,
+        shared_cloud_reco_client: CloudRecoService,
+        processed_target_ids: List[str],
         high_quality_image: io.BytesIO,
     ) -> None:
         """
         By default the maximum number of results is 1.
         """
-        target_id = vws_client.add_target(
-            name=uuid.uuid4().hex,
-            width=1,
-            image=high_quality_image,
-            active_flag=True,
-            application_metadata=None,
-        )
-        target_id_2 = vws_client.add_target(
-            name=uuid.uuid4().hex,
-            width=1,
-            image=high_quality_image,
-            active_flag=True,
-            application_metadata=None,
-        )
-        vws_client.wait_for_target_processed(target_id=target_id)
-        vws_client.wait_for_target_processed(target_id=target_id_2)
-        matches = cloud_reco_client.query(image=high_quality_image)
+        assert len(processed_target_ids) > 1
+        matches = shared_cloud_reco_client.query(image=high_quality_image)
         assert len(matches) == 1
 
     def test_custom(
         self,
-        vws_client: VWS,
-        cloud_reco_client: CloudRecoService,
+        shared_cloud_reco_client: CloudRecoService,
+        processed_target_ids: List[str],
         high_quality_image: io.BytesIO,
     ) -> None:
         """
         It is possible to set a custom ``max_num_results``.
         """
-        target_id = vws_client.add_target(
-            name=uuid.uuid4().hex,
-            width=1,
-            image=high_quality_image,
-            active_flag=True,
-            application_metadata=None,
-        )
-        target_id_2 = vws_client.add_target(
-            name=uuid.uuid4().hex,
-            width=1,
-            image=high_quality_image,
-            active_flag=True,
-            application_metadata=None,
-        )
-        target_id_3 = vws_client.add_target(
-            name=uuid.uuid4().hex,
-            width=1,
-            image=high_quality_image,
-            active_flag=True,
-            application_metadata=None,
-        )
-        vws_client.wait_for_target_processed(target_id=target_id)
-        vws_client.wait_for_target_processed(target_id=target_id_2)
-        vws_client.wait_for_target_processed(target_id=target_id_3)
-        matches = cloud_reco_client.query(
+        assert len(processed_target_ids) > 2
+        matches = shared_cloud_reco_client.query(
             image=high_quality_image,
             max_num_results=2,
         )
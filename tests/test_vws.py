@@ -2,20 +2,29 @@
 Tests for helper functions for managing a Vuforia database.
 """
 
+import asyncio
 import base64
 import datetime
 import io
 import random
+import threading
+import time
 import uuid
-from typing import Optional
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
 
 import pytest
+import requests
+import requests_mock
 from freezegun import freeze_time
 from mock_vws import MockVWS
 from mock_vws.database import VuforiaDatabase
 
 from vws import VWS, CloudRecoService
+from vws._response_cache import DecodedResponse, ResponseCache
 from vws.exceptions.custom_exceptions import TargetProcessingTimeout
+from vws.exceptions.vws_exceptions import Fail
 from vws.reports import (
     DatabaseSummaryReport,
     TargetRecord,
@@ -123,6 +132,521 @@ class TestCustomBaseVWSURL:
             )
 
 
+class TestContextManager:
+    """
+    Tests for using the client as a context manager.
+    """
+
+    def test_context_manager(self, vws_client: VWS) -> None:
+        """
+        The client can be used as a context manager, and can be closed more
+        than once.
+        """
+        with vws_client as entered_client:
+            assert entered_client is vws_client
+            assert vws_client.list_targets() == []
+
+        vws_client.close()
+
+
+_TARGETS_URL = 'https://vws.vuforia.com/targets'
+
+# The longest time to wait for another thread before failing a test.
+_EVENT_TIMEOUT_SECONDS = 10
+
+
+def _stub_vws_client() -> VWS:
+    """
+    Return a VWS client for use with stubbed responses.
+    """
+    return VWS(server_access_key='access_key', server_secret_key='secret_key')
+
+
+def _target_record_json(status: str) -> Dict[str, Any]:
+    """
+    Return the body of a successful target record response.
+    """
+    return {
+        'result_code': 'Success',
+        'status': status,
+        'target_record': {
+            'target_id': 'x',
+            'active_flag': True,
+            'name': 'x',
+            'width': 1,
+            'tracking_rating': 5,
+            'reco_rating': '',
+        },
+    }
+
+
+def _target_summary_json(status: str) -> Dict[str, Any]:
+    """
+    Return the body of a successful target summary report response.
+    """
+    return {
+        'result_code': 'Success',
+        'status': status,
+        'database_name': 'x',
+        'target_name': 'x',
+        'upload_date': '2020-01-01',
+        'active_flag': True,
+        'tracking_rating': -1,
+        'total_recos': 0,
+        'current_month_recos': 0,
+        'previous_month_recos': 0,
+    }
+
+
+def _list_targets_response(
+    results: List[str],
+    cache_control: str,
+) -> Dict[str, Any]:
+    """
+    Return a stubbed successful target list response.
+    """
+    return {
+        'json': {'result_code': 'Success', 'results': results},
+        'headers': {'Cache-Control': cache_control},
+    }
+
+
+def _wait_for_revalidation(
+    vws_client: VWS,
+    request_path: str,
+) -> None:
+    """
+    Wait until a response is not being revalidated in the background.
+    """
+    # pylint: disable=protected-access
+    response_cache = vws_client._response_cache
+    deadline = time.monotonic() + _EVENT_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        with response_cache._lock:
+            if request_path not in response_cache._revalidating:
+                return
+        time.sleep(0.01)
+
+    raise AssertionError(f'{request_path} is still being revalidated.')
+
+
+class TestCacheControl:
+    """
+    Tests for reusing responses as allowed by ``Cache-Control`` headers.
+    """
+
+    def test_max_age(self) -> None:
+        """
+        A response is reused for ``max-age`` seconds.
+        """
+        with requests_mock.Mocker() as mock, _stub_vws_client() as client:
+            mock.get(
+                _TARGETS_URL,
+                [
+                    _list_targets_response(
+                        results=['a'],
+                        cache_control='public, max-age=60',
+                    ),
+                    _list_targets_response(results=['b'], cache_control=''),
+                ],
+            )
+            assert client.list_targets() == ['a']
+            assert client.list_targets() == ['a']
+
+        assert mock.call_count == 1
+
+    def test_returned_list_copied(self) -> None:
+        """
+        Changing a list returned from a reused response does not change what
+        later calls return.
+        """
+        with requests_mock.Mocker() as mock, _stub_vws_client() as client:
+            mock.get(
+                _TARGETS_URL,
+                **_list_targets_response(
+                    results=['a'],
+                    cache_control='max-age=60',
+                ),
+            )
+            client.list_targets().append('b')
+            assert client.list_targets() == ['a']
+
+        assert mock.call_count == 1
+
+    @pytest.mark.parametrize(
+        'cache_control',
+        ['no-store, no-cache', 'no-cache', 'max-age=60, no-store'],
+    )
+    def test_not_stored(self, cache_control: str) -> None:
+        """
+        A response with ``no-store`` or ``no-cache`` is not reused, even for
+        details of a target which would otherwise be reused briefly.
+        """
+        with requests_mock.Mocker() as mock, _stub_vws_client() as client:
+            mock.get(
+                _TARGETS_URL + '/x',
+                json=_target_record_json(status='success'),
+                headers={'Cache-Control': cache_control},
+            )
+            client.get_target_record(target_id='x')
+            client.get_target_record(target_id='x')
+
+        assert mock.call_count == 2
+
+    @pytest.mark.parametrize(
+        'status, expected_call_count',
+        [('success', 1), ('processing', 2)],
+    )
+    def test_default_lifetime(
+        self,
+        status: str,
+        expected_call_count: int,
+    ) -> None:
+        """
+        Details of a target which is not processing are reused briefly when
+        there is no ``Cache-Control`` header.
+        """
+        with requests_mock.Mocker() as mock, _stub_vws_client() as client:
+            mock.get(
+                _TARGETS_URL + '/x',
+                json=_target_record_json(status=status),
+            )
+            client.get_target_record(target_id='x')
+            client.get_target_record(target_id='x')
+
+        assert mock.call_count == expected_call_count
+
+    def test_stale_while_revalidate(self) -> None:
+        """
+        A stale response within its ``stale-while-revalidate`` window is
+        returned while it is replaced in the background.
+        """
+        with requests_mock.Mocker() as mock, _stub_vws_client() as client:
+            mock.get(
+                _TARGETS_URL,
+                [
+                    _list_targets_response(
+                        results=['a'],
+                        cache_control='max-age=0, stale-while-revalidate=60',
+                    ),
+                    _list_targets_response(
+                        results=['b'],
+                        cache_control='max-age=60',
+                    ),
+                ],
+            )
+            assert client.list_targets() == ['a']
+            assert client.list_targets() == ['a']
+            _wait_for_revalidation(vws_client=client, request_path='/targets')
+            assert client.list_targets() == ['b']
+
+        assert mock.call_count == 2
+
+    def test_revalidation_fails(self) -> None:
+        """
+        If revalidating a stale response fails, the stale response is
+        discarded and the next request is made directly.
+        """
+        fail_response = {
+            'status_code': 400,
+            'json': {'result_code': 'Fail'},
+        }
+        with requests_mock.Mocker() as mock, _stub_vws_client() as client:
+            mock.get(
+                _TARGETS_URL,
+                [
+                    _list_targets_response(
+                        results=['a'],
+                        cache_control='max-age=0, stale-while-revalidate=60',
+                    ),
+                    fail_response,
+                    fail_response,
+                ],
+            )
+            assert client.list_targets() == ['a']
+            assert client.list_targets() == ['a']
+            _wait_for_revalidation(vws_client=client, request_path='/targets')
+            with pytest.raises(Fail):
+                client.list_targets()
+
+        assert mock.call_count == 3
+
+    @pytest.mark.parametrize(
+        'status_code, result_code',
+        [(200, 'Success'), (400, 'Fail')],
+    )
+    def test_invalidated_while_revalidating(
+        self,
+        status_code: int,
+        result_code: str,
+    ) -> None:
+        """
+        A response fetched in the background is not stored if the client
+        makes a change while it is being fetched, and the stale response is
+        not reused while it is being fetched.
+        """
+        with requests_mock.Mocker() as mock, _stub_vws_client() as client:
+
+            def revalidation_json(
+                request: Any,  # pylint: disable=unused-argument
+                context: Any,
+            ) -> Dict[str, Any]:
+                # The stale response is still used, and is not revalidated
+                # twice at once.
+                assert client.list_targets() == ['a']
+                client.delete_target(target_id='x')
+                context.status_code = status_code
+                return {'result_code': result_code, 'results': ['b']}
+
+            mock.get(
+                _TARGETS_URL,
+                [
+                    _list_targets_response(
+                        results=['a'],
+                        cache_control='max-age=0, stale-while-revalidate=60',
+                    ),
+                    {
+                        'json': revalidation_json,
+                        'headers': {'Cache-Control': 'max-age=60'},
+                    },
+                    _list_targets_response(results=['c'], cache_control=''),
+                ],
+            )
+            mock.delete(_TARGETS_URL + '/x', json={'result_code': 'Success'})
+            assert client.list_targets() == ['a']
+            assert client.list_targets() == ['a']
+            _wait_for_revalidation(vws_client=client, request_path='/targets')
+            assert client.list_targets() == ['c']
+
+        assert mock.call_count == 4
+
+    def test_closed(self) -> None:
+        """
+        After the client is closed, stale responses are not revalidated in
+        the background.
+        """
+        with requests_mock.Mocker() as mock:
+            mock.get(
+                _TARGETS_URL,
+                [
+                    _list_targets_response(
+                        results=['a'],
+                        cache_control='max-age=0, stale-while-revalidate=60',
+                    ),
+                    _list_targets_response(results=['b'], cache_control=''),
+                ],
+            )
+            client = _stub_vws_client()
+            assert client.list_targets() == ['a']
+            client.close()
+            assert client.list_targets() == ['b']
+
+        assert mock.call_count == 2
+
+
+class TestResponseCache:
+    """
+    Tests for the cache of responses which is used by the VWS client.
+    """
+
+    def test_oldest_discarded(self) -> None:
+        """
+        When the maximum number of responses is stored, the oldest is
+        discarded.
+        """
+        fetched: List[str] = []
+        response_cache = ResponseCache(maxsize=1)
+        for request_path in ('/a', '/b', '/b', '/a'):
+
+            def fetch(request_path: str = request_path) -> DecodedResponse:
+                fetched.append(request_path)
+                return DecodedResponse(response=requests.Response(), data={})
+
+            response_cache.get(
+                request_path=request_path,
+                fetch=fetch,
+                is_cacheable=lambda data: True,
+                default_ttl_seconds=60,
+            )
+        response_cache.close()
+
+        assert fetched == ['/a', '/b', '/a']
+
+    @pytest.mark.parametrize('fetch_succeeds', [True, False])
+    def test_cleared_while_fetching(self, fetch_succeeds: bool) -> None:
+        """
+        A response is not stored if the cache is cleared while it is being
+        fetched.
+        """
+        response_cache = ResponseCache(maxsize=1)
+        fetch_count = 0
+
+        def fetch() -> DecodedResponse:
+            nonlocal fetch_count
+            fetch_count += 1
+            response_cache.clear()
+            if not fetch_succeeds:
+                raise ValueError
+            return DecodedResponse(response=requests.Response(), data={})
+
+        for _ in range(2):
+            try:
+                response_cache.get(
+                    request_path='/a',
+                    fetch=fetch,
+                    is_cacheable=lambda data: True,
+                    default_ttl_seconds=60,
+                )
+            except ValueError:
+                assert not fetch_succeeds
+        response_cache.close()
+
+        assert fetch_count == 2
+
+    def test_concurrent_requests_shared(self) -> None:
+        """
+        Concurrent requests for the same request path share one fetch, and
+        a failed fetch is shared and not stored.
+        """
+        fetch_started = threading.Event()
+        finish_fetch = threading.Event()
+        in_flight_awaited = threading.Event()
+        fetch_count = 0
+
+        class _AwaitedFuture(Future):
+            """
+            A future which records when a caller waits for its result.
+            """
+
+            def result(self, timeout: Optional[float] = None) -> Any:
+                in_flight_awaited.set()
+                return super().result(timeout=timeout)
+
+        def fetch() -> DecodedResponse:
+            nonlocal fetch_count
+            fetch_count += 1
+            fetch_started.set()
+            assert finish_fetch.wait(timeout=_EVENT_TIMEOUT_SECONDS)
+            raise ValueError(fetch_count)
+
+        response_cache = ResponseCache(maxsize=1)
+        errors: List[BaseException] = []
+
+        def get() -> None:
+            try:
+                response_cache.get(
+                    request_path='/a',
+                    fetch=fetch,
+                    is_cacheable=lambda data: True,
+                    default_ttl_seconds=60,
+                )
+            except ValueError as exc:
+                errors.append(exc)
+
+        with patch('vws._response_cache.Future', _AwaitedFuture):
+            first = threading.Thread(target=get)
+            first.start()
+            assert fetch_started.wait(timeout=_EVENT_TIMEOUT_SECONDS)
+            second = threading.Thread(target=get)
+            second.start()
+            assert in_flight_awaited.wait(timeout=_EVENT_TIMEOUT_SECONDS)
+            finish_fetch.set()
+            first.join()
+            second.join()
+
+        assert [error.args for error in errors] == [(1,), (1,)]
+
+        get()
+        response_cache.close()
+        assert fetch_count == 2
+
+
+class TestConditionalRequests:
+    """
+    Tests for making ``GET`` requests conditional on an earlier ``ETag``.
+    """
+
+    def test_not_modified(self) -> None:
+        """
+        When Vuforia responds with ``304 Not Modified`` to a request made with
+        the ``ETag`` of an earlier response, the earlier response is used.
+        """
+        with requests_mock.Mocker() as mock, VWS(
+            server_access_key='access_key',
+            server_secret_key='secret_key',
+        ) as vws_client:
+            mock.get(
+                'https://vws.vuforia.com/targets',
+                [
+                    {
+                        'json': {'result_code': 'Success', 'results': ['a']},
+                        'headers': {'ETag': '"1"'},
+                    },
+                    {'status_code': 304},
+                ],
+            )
+            assert vws_client.list_targets() == ['a']
+            assert vws_client.list_targets() == ['a']
+
+        first_request, second_request = mock.request_history
+        assert 'If-None-Match' not in first_request.headers
+        assert second_request.headers['If-None-Match'] == '"1"'
+
+    def test_returned_list_copied(self) -> None:
+        """
+        Changing a list returned from a response which is used again after
+        ``304 Not Modified`` does not change what later calls return.
+        """
+        with requests_mock.Mocker() as mock, _stub_vws_client() as client:
+            mock.get(
+                'https://vws.vuforia.com/duplicates/x',
+                [
+                    {
+                        'json': {
+                            'result_code': 'Success',
+                            'similar_targets': ['a'],
+                        },
+                        'headers': {'ETag': '"1"'},
+                    },
+                    {'status_code': 304},
+                ],
+            )
+            client.get_duplicate_targets(target_id='x').clear()
+            assert client.get_duplicate_targets(target_id='x') == ['a']
+
+        assert mock.call_count == 2
+
+    def test_stored_responses_limited(self) -> None:
+        """
+        Only a limited number of responses with an ``ETag`` are stored, and
+        the oldest is discarded first.
+        """
+        response_cache = ResponseCache(maxsize=1)
+        response = DecodedResponse(response=requests.Response(), data={})
+        response_cache.store_etag(
+            request_path='/targets/a',
+            etag='"1"',
+            response=response,
+        )
+        response_cache.store_etag(
+            request_path='/targets/b',
+            etag='"2"',
+            response=response,
+        )
+        assert response_cache.get_etag(request_path='/targets/a') is None
+        assert response_cache.get_etag(request_path='/targets/b') == (
+            '"2"',
+            response,
+        )
+        response_cache.store_etag(
+            request_path='/targets/b',
+            etag=None,
+            response=response,
+        )
+        assert response_cache.get_etag(request_path='/targets/b') is None
+        response_cache.close()
+
+
 class TestListTargets:
     """
     Tests for listing targets.
@@ -282,6 +806,72 @@ class TestGetTargetRecord:
         assert result.target_record == expected_target_record
         assert result.status == TargetStatuses.PROCESSING
 
+    def test_updated_target_record(
+        self,
+        vws_client: VWS,
+        high_quality_image: io.BytesIO,
+    ) -> None:
+        """
+        Details of a target which were recently fetched are not reused after
+        the target is updated.
+        """
+        target_id = vws_client.add_target(
+            name='x',
+            width=1,
+            image=high_quality_image,
+            active_flag=True,
+            application_metadata=None,
+        )
+        vws_client.wait_for_target_processed(target_id=target_id)
+        result = vws_client.get_target_record(target_id=target_id)
+        assert result.target_record.name == 'x'
+        assert vws_client.get_target_record(target_id=target_id) == result
+
+        vws_client.update_target(target_id=target_id, name='a')
+        result = vws_client.get_target_record(target_id=target_id)
+        assert result.target_record.name == 'a'
+
+
+class TestAsync:
+    """
+    Tests for the asynchronous variants of client methods.
+    """
+
+    def test_async_methods(
+        self,
+        vws_client: VWS,
+        high_quality_image: io.BytesIO,
+    ) -> None:
+        """
+        It is possible to add, list and get targets concurrently.
+        """
+
+        async def add_and_list_targets() -> None:
+            target_ids = await asyncio.gather(
+                *(
+                    vws_client.add_target_async(
+                        name=name,
+                        width=1,
+                        image=high_quality_image,
+                        active_flag=True,
+                        application_metadata=None,
+                    )
+                    for name in ('x', 'a')
+                ),
+            )
+            listed_target_ids = await vws_client.list_targets_async()
+            assert sorted(listed_target_ids) == sorted(target_ids)
+            records = await asyncio.gather(
+                *(
+                    vws_client.get_target_record_async(target_id=target_id)
+                    for target_id in target_ids
+                ),
+            )
+            names = [record.target_record.name for record in records]
+            assert names == ['x', 'a']
+
+        asyncio.run(add_and_list_targets())
+
 
 class TestWaitForTargetProcessed:
     """
@@ -347,14 +937,11 @@ class TestWaitForTargetProcessed:
                 # Request after 0.2 seconds - not processed
                 1
                 +
-                # Request after 0.4 seconds - not processed
+                # Request after a further 0.4 seconds - processed
                 # This assumes that there is less than 0.1 seconds taken
                 # between the start of the target processing and the start of
                 # waiting for the target to be processed.
                 1
-                +
-                # Request after 0.6 seconds - processed
-                1
             )
             # At the time of writing there is a bug which prevents request
             # usage from being tracked so we cannot track this.
@@ -405,7 +992,7 @@ class TestWaitForTargetProcessed:
                 # waiting for the target to be processed.
                 1
                 +
-                # Request after 0.6 seconds - processed
+                # Request after a further 0.6 seconds - processed
                 1
             )
             # At the time of writing there is a bug which prevents request
@@ -446,11 +1033,252 @@ class TestWaitForTargetProcessed:
 
             vws_client.wait_for_target_processed(
                 target_id=target_id,
-                timeout_seconds=0.5,
+                timeout_seconds=1,
+            )
+            report = vws_client.get_target_summary_report(target_id=target_id)
+            assert report.status != TargetStatuses.PROCESSING
+
+    def test_no_timeout(self) -> None:
+        """
+        If no timeout is given, requests are not given a timeout.
+        """
+        with requests_mock.Mocker() as mock, _stub_vws_client() as client:
+            mock.get(
+                'https://vws.vuforia.com/summary/x',
+                [
+                    {'json': _target_summary_json(status='processing')},
+                    {'json': _target_summary_json(status='success')},
+                ],
+            )
+            client.wait_for_target_processed(
+                target_id='x',
+                timeout_seconds=None,
+            )
+
+        timeouts = [request.timeout for request in mock.request_history]
+        assert timeouts == [None, None]
+
+    def test_request_timeout(self) -> None:
+        """
+        Each request is given the time remaining before the timeout as its own
+        timeout.
+        """
+        with requests_mock.Mocker() as mock, _stub_vws_client() as client:
+            mock.get(
+                'https://vws.vuforia.com/summary/x',
+                json=_target_summary_json(status='processing'),
+            )
+            with pytest.raises(TargetProcessingTimeout):
+                client.wait_for_target_processed(
+                    target_id='x',
+                    timeout_seconds=0.5,
+                )
+
+        timeouts = [request.timeout for request in mock.request_history]
+        assert len(timeouts) > 1
+        assert all(0 < timeout <= 0.5 for timeout in timeouts)
+        assert timeouts == sorted(timeouts, reverse=True)
+
+    def test_slow_response(self) -> None:
+        """
+        A request which does not get a response before the timeout causes a
+        ``TargetProcessingTimeout``.
+        """
+        with requests_mock.Mocker() as mock, _stub_vws_client() as client:
+            mock.get(
+                'https://vws.vuforia.com/summary/x',
+                exc=requests.exceptions.ReadTimeout,
             )
+            with pytest.raises(TargetProcessingTimeout):
+                client.wait_for_target_processed(
+                    target_id='x',
+                    timeout_seconds=0.5,
+                )
+
+
+class TestWaitForTargetsProcessed:
+    """
+    Tests for waiting for multiple targets to be processed.
+    """
+
+    def test_wait_for_targets_processed(
+        self,
+        vws_client: VWS,
+        high_quality_image: io.BytesIO,
+    ) -> None:
+        """
+        It is possible to wait until multiple targets are processed.
+        """
+        target_ids = [
+            vws_client.add_target(
+                name=uuid.uuid4().hex,
+                width=1,
+                image=high_quality_image,
+                active_flag=True,
+                application_metadata=None,
+            )
+            for _ in range(2)
+        ]
+        vws_client.wait_for_targets_processed(target_ids=target_ids)
+        for target_id in target_ids:
             report = vws_client.get_target_summary_report(target_id=target_id)
             assert report.status != TargetStatuses.PROCESSING
 
+    def test_custom_timeout(
+        self,
+        high_quality_image: io.BytesIO,
+    ) -> None:
+        """
+        It is possible to set a maximum timeout.
+        """
+        with MockVWS(processing_time_seconds=0.5) as mock:
+            database = VuforiaDatabase()
+            mock.add_database(database=database)
+            vws_client = VWS(
+                server_access_key=database.server_access_key,
+                server_secret_key=database.server_secret_key,
+            )
+
+            target_id = vws_client.add_target(
+                name='x',
+                width=1,
+                image=high_quality_image,
+                active_flag=True,
+                application_metadata=None,
+            )
+
+            with pytest.raises(TargetProcessingTimeout):
+                vws_client.wait_for_targets_processed(
+                    target_ids=[target_id],
+                    timeout_seconds=0.1,
+                )
+
+            vws_client.wait_for_targets_processed(
+                target_ids=[target_id],
+                timeout_seconds=1,
+            )
+            report = vws_client.get_target_summary_report(target_id=target_id)
+            assert report.status != TargetStatuses.PROCESSING
+
+    def test_async(
+        self,
+        high_quality_image: io.BytesIO,
+    ) -> None:
+        """
+        It is possible to wait for targets from within a running event loop.
+        """
+        with MockVWS(processing_time_seconds=0.5) as mock:
+            database = VuforiaDatabase()
+            mock.add_database(database=database)
+            vws_client = VWS(
+                server_access_key=database.server_access_key,
+                server_secret_key=database.server_secret_key,
+            )
+
+            target_id = vws_client.add_target(
+                name='x',
+                width=1,
+                image=high_quality_image,
+                active_flag=True,
+                application_metadata=None,
+            )
+
+            async def wait_for_target() -> None:
+                with pytest.raises(TargetProcessingTimeout):
+                    await vws_client.wait_for_targets_processed_async(
+                        target_ids=[target_id],
+                        timeout_seconds=0.1,
+                    )
+
+                await vws_client.wait_for_targets_processed_async(
+                    target_ids=[target_id],
+                    timeout_seconds=1,
+                )
+
+            asyncio.run(wait_for_target())
+            report = vws_client.get_target_summary_report(target_id=target_id)
+            assert report.status != TargetStatuses.PROCESSING
+
+    def test_async_slow_response(self) -> None:
+        """
+        A request which does not get a response before the timeout causes a
+        ``TargetProcessingTimeout`` when waiting within a running event loop.
+        """
+
+        async def wait_for_target(client: VWS) -> None:
+            await client.wait_for_targets_processed_async(
+                target_ids=['x'],
+                timeout_seconds=0.5,
+            )
+
+        with requests_mock.Mocker() as mock, _stub_vws_client() as client:
+            mock.get(
+                'https://vws.vuforia.com/summary/x',
+                exc=requests.exceptions.ReadTimeout,
+            )
+            with pytest.raises(TargetProcessingTimeout):
+                asyncio.run(wait_for_target(client=client))
+
+        [request] = mock.request_history
+        assert 0 < request.timeout <= 0.5
+
+    def test_no_timeout(self) -> None:
+        """
+        If no timeout is given, requests are not given a timeout.
+        """
+        with requests_mock.Mocker() as mock, _stub_vws_client() as client:
+            mock.get(
+                'https://vws.vuforia.com/summary/x',
+                [
+                    {'json': _target_summary_json(status='processing')},
+                    {'json': _target_summary_json(status='success')},
+                ],
+            )
+            client.wait_for_targets_processed(
+                target_ids=['x'],
+                timeout_seconds=None,
+            )
+
+        timeouts = [request.timeout for request in mock.request_history]
+        assert timeouts == [None, None]
+
+    def test_request_timeout(self) -> None:
+        """
+        Each request is given the time remaining before the timeout as its own
+        timeout.
+        """
+        with requests_mock.Mocker() as mock, _stub_vws_client() as client:
+            for target_id in ('x', 'y'):
+                mock.get(
+                    f'https://vws.vuforia.com/summary/{target_id}',
+                    json=_target_summary_json(status='processing'),
+                )
+            with pytest.raises(TargetProcessingTimeout):
+                client.wait_for_targets_processed(
+                    target_ids=['x', 'y'],
+                    timeout_seconds=0.5,
+                )
+
+        timeouts = [request.timeout for request in mock.request_history]
+        assert len(timeouts) > 2
+        assert all(0 < timeout <= 0.5 for timeout in timeouts)
+
+    def test_slow_response(self) -> None:
+        """
+        A request which does not get a response before the timeout causes a
+        ``TargetProcessingTimeout``.
+        """
+        with requests_mock.Mocker() as mock, _stub_vws_client() as client:
+            mock.get(
+                'https://vws.vuforia.com/summary/x',
+                exc=requests.exceptions.ReadTimeout,
+            )
+            with pytest.raises(TargetProcessingTimeout):
+                client.wait_for_targets_processed(
+                    target_ids=['x'],
+                    timeout_seconds=0.5,
+                )
+
 
 class TestGetDuplicateTargets:
     """